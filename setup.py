@@ -21,7 +21,6 @@ setup(name='polyswarm-client',
           'aiodns==1.2.0',
           'aioredis==1.3.1',
           'aioresponses==0.6.0',
-          'aiorwlock==0.6.0',
           'asynctest==0.12.2',
           'backoff==1.10.0',
           'base58==0.2.5',
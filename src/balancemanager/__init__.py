@@ -153,8 +153,9 @@ class DepositStake(BalanceManager):
         It also checks the balances to make sure the source chain wallet can cover the transfer.
         """
         balance = await self.client.balances.get_nct_balance(chain)
-        min_stake = int(await self.client.staking.parameters[chain].get('minimum_stake'))
-        max_stake = int(await self.client.staking.parameters[chain].get('maximum_stake'))
+        min_stake, max_stake = await self.client.staking.parameters[chain].get_many('minimum_stake', 'maximum_stake')
+        min_stake = int(min_stake)
+        max_stake = int(max_stake)
         staking_balance = int(await self.client.staking.get_total_balance(chain))
 
         if self.transfer_all:
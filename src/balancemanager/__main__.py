@@ -60,7 +60,7 @@ def cli(log, client_log, log_format):
     loglevel = getattr(logging, log.upper(), None)
     clientlevel = getattr(logging, client_log.upper(), None)
     if not isinstance(loglevel, int) or not isinstance(clientlevel, int):
-        logging.error('invalid log level')
+        logger.error('invalid log level')
         sys.exit(-1)
 
     init_logging(['balancemanager'], log_format, loglevel)
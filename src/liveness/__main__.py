@@ -6,6 +6,8 @@ import warnings
 from polyswarmclient.config import init_logging
 from polyswarmclient.liveness.local import LocalLivenessCheck
 
+logger = logging.getLogger(__name__)
+
 
 @click.command()
 @click.option('--log', default='WARNING',
@@ -23,7 +25,7 @@ def main(log, log_format, loop_update_threshold, average_bounty_wait_threshold):
 
     loglevel = getattr(logging, log.upper(), None)
     if not isinstance(loglevel, int):
-        logging.error('invalid log level')
+        logger.error('invalid log level')
         sys.exit(-1)
 
     init_logging(['liveness'], log_format, loglevel)
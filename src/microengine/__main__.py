@@ -139,7 +139,7 @@ def main(log, client_log, polyswarmd_addr, keyfile, password, api_key, backend,
     loglevel = getattr(logging, log.upper(), None)
     clientlevel = getattr(logging, client_log.upper(), None)
     if not isinstance(loglevel, int) or not isinstance(clientlevel, int):
-        logging.error('invalid log level')
+        logger.error('invalid log level')
         sys.exit(-1)
 
     logger_name, microengine_class = choose_backend(backend)
@@ -29,10 +29,11 @@ class Microengine(AbstractMicroengine):
             raise ValueError('Queue name cannot end with `_results`')
 
         self.client.on_run.register(self.__handle_run)
-        self.redis = None
+        self.producer = None
 
     async def __handle_run(self, chain):
-        if self.redis is None:
+        # on_run fires once per chain, but one producer serves them all
+        if self.producer is None:
             redis_uri = 'redis://' + REDIS_ADDR
             rate_limit = RedisDailyRateLimit(redis_uri, QUEUE, RATE_LIMIT)
             self.producer = Producer(self.client, redis_uri, QUEUE, TIME_TO_POST_ASSERTION,
@@ -16,7 +16,7 @@ from polyswarmclient.offersclient import OffersClient
 from polyswarmclient.relayclient import RelayClient
 from polyswarmclient.transaction import NonceManager
 from polyswarmclient.utils import asyncio_join, asyncio_stop, configure_event_loop, exit, MAX_WAIT, check_response, \
-    is_valid_ipfs_uri
+    is_valid_ipfs_uri, read_json
 
 from web3 import Web3
 
@@ -26,6 +26,8 @@ w3 = Web3()
 REQUEST_TIMEOUT = 300.0
 MAX_ARTIFACTS = 256
 RATE_LIMIT_SLEEP = 2.0
+KEEPALIVE_TIMEOUT = 60.0
+DNS_CACHE_TTL = 300
 
 
 class Client(object):
@@ -150,8 +152,8 @@ class Client(object):
         await self.liveness_recorder.start()
         try:
             # XXX: Set the timeouts here to reasonable values, probably should be configurable
-            # No limits on connections
-            conn = aiohttp.TCPConnector(limit=100)
+            # No limits on connections, keep idle ones open across quiet blocks so requests reuse them
+            conn = aiohttp.TCPConnector(limit=100, keepalive_timeout=KEEPALIVE_TIMEOUT, ttl_dns_cache=DNS_CACHE_TTL)
             timeout = aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
             async with aiohttp.ClientSession(connector=conn, timeout=timeout) as self.__session:
                 self.bounties = BountiesClient(self)
@@ -233,7 +235,7 @@ class Client(object):
                             tries += 1
                             continue
 
-                        response = await raw_response.json()
+                        response = await read_json(raw_response)
                     except (ValueError, aiohttp.ContentTypeError):
                         response = await raw_response.read() if raw_response else 'None'
                         logger.error('Received non-json response from polyswarmd: %s, url: %s', response, uri)
@@ -497,7 +499,7 @@ class Client(object):
                                 tries += 1
                                 continue
 
-                            response = await raw_response.json()
+                            response = await read_json(raw_response)
                         except (ValueError, aiohttp.ContentTypeError):
                             response = await raw_response.read() if raw_response else 'None'
                             logger.error('Received non-json response from polyswarmd: %s, uri: %s', response, uri)
@@ -544,21 +546,22 @@ class Client(object):
         """
         if chain != 'home' and chain != 'side':
             raise ValueError('Chain parameter must be `home` or `side`, got {0}'.format(chain))
+        loop = asyncio.get_event_loop()
         while self.__schedules[chain].peek() and self.__schedules[chain].peek()[0] < number:
             exp, task = self.__schedules[chain].get()
             if isinstance(task, events.RevealAssertion):
-                asyncio.get_event_loop().create_task(
+                loop.create_task(
                     self.on_reveal_assertion_due.run(bounty_guid=task.guid, index=task.index, nonce=task.nonce,
                                                      verdicts=task.verdicts, metadata=task.metadata, chain=chain))
             elif isinstance(task, events.SettleBounty):
-                asyncio.get_event_loop().create_task(
+                loop.create_task(
                     self.on_settle_bounty_due.run(bounty_guid=task.guid, chain=chain))
             elif isinstance(task, events.VoteOnBounty):
-                asyncio.get_event_loop().create_task(
+                loop.create_task(
                     self.on_vote_on_bounty_due.run(bounty_guid=task.guid, votes=task.votes,
                                                    valid_bloom=task.valid_bloom, chain=chain))
             elif isinstance(task, events.WithdrawStake):
-                asyncio.get_event_loop().create_task(
+                loop.create_task(
                     self.on_withdraw_stake_due.run(amount=task.amount, chain=chain))
 
     async def listen_for_events(self, chain):
@@ -575,6 +578,7 @@ class Client(object):
         wsuri = f'{self.polyswarmd_uri.replace("http", "ws", 1)}/events?chain={chain}'
         last_block = 0
         retry = 0
+        loop = asyncio.get_event_loop()
         while True:
             try:
                 async with websockets.connect(wsuri) as ws:
@@ -616,9 +620,9 @@ class Client(object):
                             if number % 100 == 0:
                                 logger.debug('Block %s on chain %s', number, chain)
 
-                            asyncio.get_event_loop().create_task(self.on_new_block.run(number=number, chain=chain))
-                            asyncio.get_event_loop().create_task(self.__handle_scheduled_events(number, chain=chain))
-                            asyncio.get_event_loop().create_task(self.liveness_recorder.advance_time(number))
+                            loop.create_task(self.on_new_block.run(number=number, chain=chain))
+                            loop.create_task(self.__handle_scheduled_events(number, chain=chain))
+                            loop.create_task(self.liveness_recorder.advance_time(number))
                         elif event == 'fee_update':
                             d = {'bounty_fee': data.get('bounty_fee'), 'assertion_fee': data.get('assertion_fee')}
                             await self.bounties.parameters[chain].update({k: v for k, v in d.items() if v is not None})
@@ -627,34 +631,34 @@ class Client(object):
                                  'arbiter_vote_window': data.get('arbiter_vote_window')}
                             await self.bounties.parameters[chain].update({k: v for k, v in d.items() if v is not None})
                         elif event == 'bounty':
-                            asyncio.get_event_loop().create_task(
+                            loop.create_task(
                                 self.on_new_bounty.run(**data, block_number=block_number, txhash=txhash, chain=chain))
                         elif event == 'assertion':
-                            asyncio.get_event_loop().create_task(
+                            loop.create_task(
                                 self.on_new_assertion.run(**data, block_number=block_number, txhash=txhash,
                                                           chain=chain))
                         elif event == 'reveal':
-                            asyncio.get_event_loop().create_task(
+                            loop.create_task(
                                 self.on_reveal_assertion.run(**data, block_number=block_number, txhash=txhash,
                                                              chain=chain))
                         elif event == 'vote':
-                            asyncio.get_event_loop().create_task(
+                            loop.create_task(
                                 self.on_new_vote.run(**data, block_number=block_number, txhash=txhash, chain=chain))
                         elif event == 'quorum':
-                            asyncio.get_event_loop().create_task(
+                            loop.create_task(
                                 self.on_quorum_reached.run(**data, block_number=block_number, txhash=txhash,
                                                            chain=chain))
                         elif event == 'settled_bounty':
-                            asyncio.get_event_loop().create_task(
+                            loop.create_task(
                                 self.on_settled_bounty.run(**data, block_number=block_number, txhash=txhash,
                                                            chain=chain))
                         elif event == 'deprecated':
-                            asyncio.get_event_loop().create_task(
+                            loop.create_task(
                                 self.on_deprecated.run(**data, block_number=block_number, txhash=txhash,
                                                        chain=chain))
 
                         elif event == 'initialized_channel':
-                            asyncio.get_event_loop().create_task(
+                            loop.create_task(
                                 self.on_initialized_channel.run(**data, block_number=block_number, txhash=txhash))
                         else:
                             logger.error('Invalid event type from polyswarmd: %s', resp)
@@ -197,7 +197,9 @@ class AbstractAmbassador(ABC):
             bounty (QueuedBounty): Bounty to submit
             chain: Name of the chain to post to
         """
-        bounty_fee = await self.client.bounties.parameters[chain].get('bounty_fee')
+        parameters = self.client.bounties.parameters[chain]
+        bounty_fee, assertion_reveal_window, arbiter_vote_window = await parameters.get_many(
+            'bounty_fee', 'assertion_reveal_window', 'arbiter_vote_window')
         try:
             await self.client.balances.raise_low_balance(bounty.amount + bounty_fee, chain)
         except LowBalanceError:
@@ -210,8 +212,6 @@ class AbstractAmbassador(ABC):
                 logger.error('Failed to post bounty due to low balance. Exiting')
                 exit(1)
 
-        assertion_reveal_window = await self.client.bounties.parameters[chain].get('assertion_reveal_window')
-        arbiter_vote_window = await self.client.bounties.parameters[chain].get('arbiter_vote_window')
         metadata = None
         if bounty.metadata is not None:
             metadata = await self.client.bounties.post_metadata(bounty.metadata, chain)
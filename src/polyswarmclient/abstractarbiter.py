@@ -163,9 +163,8 @@ class AbstractArbiter(object):
         if not rollover:
             logger.critical('BountyRegistry contract is now deprecated, withdrawing stake.')
             parameters = self.client.bounties.parameters[chain]
-            assertion_reveal_window = await parameters.get('assertion_reveal_window')
-            arbiter_vote_window = await parameters.get('arbiter_vote_window')
-            max_duration = await parameters.get('max_duration')
+            assertion_reveal_window, arbiter_vote_window, max_duration = await parameters.get_many(
+                'assertion_reveal_window', 'arbiter_vote_window', 'max_duration')
             withdraw_start = block_number + max_duration + assertion_reveal_window + arbiter_vote_window
             staking_balance = await self.client.staking.get_total_balance(chain)
             ws = WithdrawStake(staking_balance)
@@ -211,8 +210,8 @@ class AbstractArbiter(object):
             logger.info('Testing mode, %s bounties remaining', self.testing - self.bounties_seen)
 
         expiration = int(expiration)
-        assertion_reveal_window = await self.client.bounties.parameters[chain].get('assertion_reveal_window')
-        arbiter_vote_window = await self.client.bounties.parameters[chain].get('arbiter_vote_window')
+        assertion_reveal_window, arbiter_vote_window = await self.client.bounties.parameters[chain].get_many(
+            'assertion_reveal_window', 'arbiter_vote_window')
 
         vote_start = expiration + assertion_reveal_window
         settle_start = expiration + assertion_reveal_window + arbiter_vote_window
@@ -107,8 +107,8 @@ class AbstractMicroengine(object):
         Returns:
             list[int]: Amount of NCT to bid in base NCT units (10 ^ -18)
         """
-        min_allowed_bid = await self.client.bounties.parameters[chain].get('assertion_bid_minimum')
-        max_allowed_bid = await self.client.bounties.parameters[chain].get('assertion_bid_maximum')
+        min_allowed_bid, max_allowed_bid = await self.client.bounties.parameters[chain].get_many(
+            'assertion_bid_minimum', 'assertion_bid_maximum')
         if self.bid_strategy is not None:
             bid = await self.bid_strategy.bid(guid,
                                               mask,
@@ -140,11 +140,12 @@ class AbstractMicroengine(object):
         Returns:
             (list(bool), list(bool), list(str)): Tuple of mask bits, verdicts, and metadatas
         """
-        async def fetch_and_scan(artifact_metadata, index):
-            content = await self.client.get_artifact(uri, index)
-            if not self.bounty_filter.is_allowed(artifact_metadata):
+        async def fetch_and_scan(artifact_metadata, index, allowed):
+            # Don't spend a download on an artifact the filters already rejected
+            if not allowed:
                 return ScanResult()
 
+            content = await self.client.get_artifact(uri, index)
             if content is not None:
                 try:
                     result = await self.scan(guid,
@@ -163,9 +164,10 @@ class AbstractMicroengine(object):
 
         artifacts = await self.client.list_artifacts(uri)
         metadata = MetadataFilter.pad_metadata(metadata, len(artifacts))
+        allowed = self.bounty_filter.filter_batch(metadata)
 
         return await asyncio.gather(*[
-            fetch_and_scan(metadata[i], i) for i in range(len(artifacts))
+            fetch_and_scan(metadata[i], i, allowed[i]) for i in range(len(artifacts))
         ])
 
     def run(self):
@@ -235,25 +237,35 @@ class AbstractMicroengine(object):
         verdicts = [r.verdict for r in results]
         confidences = [r.confidence for r in results]
         metadatas = [r.metadata for r in results]
-        combined_metadata = ';'.join(metadatas)
-
-        try:
-            if all([metadata and verdict.Verdict.validate(json.loads(metadata)) for metadata in metadatas]):
-                combined_metadata = json.dumps([json.loads(metadata) for metadata in metadatas])
-        except json.JSONDecodeError:
-            logger.exception('Error decoding assertion metadata %s', metadatas)
 
         if not any(mask):
             await self.client.liveness_recorder.remove_waiting_task(guid)
             return []
 
-        assertion_fee = await self.client.bounties.parameters[chain].get('assertion_fee')
-        assertion_reveal_window = await self.client.bounties.parameters[chain].get('assertion_reveal_window')
-        arbiter_vote_window = await self.client.bounties.parameters[chain].get('arbiter_vote_window')
+        # Only combine the metadata once we know we're asserting
+        combined_metadata = None
+        try:
+            # Parse each metadata once, and only if every artifact has some
+            if all(metadatas):
+                loaded_metadatas = [json.loads(metadata) for metadata in metadatas]
+                if all(verdict.Verdict.validate(loaded) for loaded in loaded_metadatas):
+                    combined_metadata = json.dumps(loaded_metadatas)
+        except json.JSONDecodeError:
+            logger.exception('Error decoding assertion metadata %s', metadatas)
+
+        if combined_metadata is None:
+            combined_metadata = ';'.join(metadatas)
 
+        # Bid first, a bid that raises shouldn't leave a balance request running with nobody waiting on it
         bid = await self.bid(guid, mask, verdicts, confidences, metadatas, chain)
+        # The parameter and balance lookups are read only and independent, so don't wait on them one after another
+        params, balance = await asyncio.gather(
+            self.client.bounties.parameters[chain].get_many('assertion_fee', 'assertion_reveal_window',
+                                                            'arbiter_vote_window'),
+            self.client.balances.get_nct_balance(chain))
+        assertion_fee, assertion_reveal_window, arbiter_vote_window = params
+
         # Check that microengine has sufficient balance to handle the assertion
-        balance = await self.client.balances.get_nct_balance(chain)
         if balance < assertion_fee + sum(bid):
             logger.critical('Insufficient balance to post assertion for bounty on %s. Have %s NCT. Need %s NCT',
                             chain,
@@ -269,10 +281,13 @@ class AbstractMicroengine(object):
         logger.info('Responding to %s bounty %s', artifact_type.name.lower(), guid)
         nonce, assertions = await self.client.bounties.post_assertion(guid, bid, mask, verdicts, chain)
         await self.client.liveness_recorder.remove_waiting_task(guid)
-        for a in assertions:
-            # Post metadata to IPFS and post ipfs_hash as metadata, if it exists
+        if assertions:
+            # Post metadata to IPFS and post ipfs_hash as metadata, if it exists. Every assertion reveals the same
+            # metadata, so it only needs posting once
             ipfs_hash = await self.client.bounties.post_metadata(combined_metadata, chain)
             metadata = ipfs_hash if ipfs_hash is not None else combined_metadata
+
+        for a in assertions:
             ra = RevealAssertion(guid, a['index'], nonce, verdicts, metadata)
             self.client.schedule(expiration, ra, chain)
 
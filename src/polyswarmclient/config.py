@@ -6,6 +6,8 @@ from polyswarmclient.log_formatter import JSONFormatter, ExtraTextFormatter
 
 logger = logging.getLogger(__name__)
 
+_HEX_SET = frozenset(string.hexdigits.lower())
+
 
 def validate_apikey(ctx, param, value):
     """Validates the API key passed in through click parameters"""
@@ -14,7 +16,7 @@ def validate_apikey(ctx, param, value):
         if value == param.get_default(ctx):
             return value
         # Verify we have a hex-clean API key which of the appropriate length.
-        if len(value) != 32 or not all([c in string.hexdigits.lower() for c in value]):
+        if len(value) != 32 or not all(c in _HEX_SET for c in value):
             raise click.BadParameter('API key is an invalid 16-byte hex value.')
         return value
     except ValueError:
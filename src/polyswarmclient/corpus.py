@@ -1,13 +1,16 @@
 import logging
 import os
+import shutil
 import tempfile
 import urllib.request
-from subprocess import check_call
+from concurrent.futures import ThreadPoolExecutor, wait
+from subprocess import CalledProcessError, PIPE, Popen, check_call
 
 logger = logging.getLogger(__name__)  # Initialize logger
 
 MALICIOUS_BOOTSTRAP_URL = os.getenv('MALICIOUS_BOOTSTRAP_URL')
 ARCHIVE_PASSWORD = os.getenv('ARCHIVE_PASSWORD')
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
 
 
 class DownloadToFileSystemCorpus(object):
@@ -27,28 +30,51 @@ class DownloadToFileSystemCorpus(object):
 
     def download_and_unpack(self):
         logger.info('Downloading to {0}'.format(self.base_dir))
-        for is_mal, package_name in [(True, 'malicious.tgz.gpg'), (False, 'benign.tgz.gpg')]:
-
-            mal_dir = self.mal_path if is_mal else self.benign_path
-            archive_path = os.path.join(mal_dir, package_name)
-            archive_dst = mal_dir
-            if not os.path.isdir(archive_dst):
-                os.makedirs(archive_dst, exist_ok=True)
-            archive_tgz = archive_path.rstrip('.gpg')
-            r = urllib.request.urlretrieve('{0}/{1}'.format(self.url, package_name), archive_path)
-            check_call(['gpg', '--batch', '--passphrase', ARCHIVE_PASSWORD, '--decrypt',
-                        '--no-use-agent', '--cipher-algo', 'AES256',
-                        '--yes', '-o', archive_tgz, archive_path])
-            # can do with python tar file, but being lazy
-            check_call(['tar', 'xf', archive_tgz, '-C', archive_dst])
-            os.unlink(archive_tgz)
-            os.unlink(archive_path)
+        # Archives are independent, so overlap the download of one with the decrypt/extract of the other
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [executor.submit(self._fetch_and_extract, is_mal, package_name)
+                       for is_mal, package_name in [(True, 'malicious.tgz.gpg'), (False, 'benign.tgz.gpg')]]
+            wait(futures)
+
+        # Surface any exception raised in the worker threads
+        for future in futures:
+            future.result()
+
+    def _fetch_and_extract(self, is_mal, package_name):
+        mal_dir = self.mal_path if is_mal else self.benign_path
+        archive_dst = mal_dir
+        if not os.path.isdir(archive_dst):
+            os.makedirs(archive_dst, exist_ok=True)
+        archive_tgz = os.path.join(mal_dir, package_name).rstrip('.gpg')
+        # Stream the encrypted archive straight into gpg rather than staging it on disk first
+        with urllib.request.urlopen('{0}/{1}'.format(self.url, package_name)) as response:
+            gpg = Popen(['gpg', '--batch', '--passphrase', ARCHIVE_PASSWORD, '--decrypt',
+                         '--no-use-agent', '--cipher-algo', 'AES256',
+                         '--yes', '-o', archive_tgz], stdin=PIPE)
+            try:
+                shutil.copyfileobj(response, gpg.stdin, length=DOWNLOAD_CHUNK_SIZE)
+            finally:
+                gpg.stdin.close()
+                returncode = gpg.wait()
+
+        if returncode != 0:
+            raise CalledProcessError(returncode, gpg.args)
+
+        # can do with python tar file, but being lazy
+        check_call(['tar', 'xf', archive_tgz, '-C', archive_dst])
+        os.unlink(archive_tgz)
 
     def _get_pth_listing(self, p):
         artifacts = []
-        for root, dirs, files in os.walk(p):
-            for f in files:
-                artifacts.append(os.path.join(root, f))
+        # scandir caches the entry type from readdir, avoiding a stat per file that os.walk would incur
+        stack = [p]
+        while stack:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif not entry.is_dir():
+                        artifacts.append(entry.path)
         return artifacts
 
     def get_malicious_file_list(self):
@@ -60,4 +86,5 @@ class DownloadToFileSystemCorpus(object):
     def download_truth(self):
         u = '{0}/{1}'.format(self.url, self.truth_fname)
         logger.info('Fetching truth database {0}'.format(u))
-        r = urllib.request.urlretrieve(u, self.truth_db_pth)
+        with urllib.request.urlopen(u) as response, open(self.truth_db_pth, 'wb') as f:
+            shutil.copyfileobj(response, f, length=DOWNLOAD_CHUNK_SIZE)
@@ -1,12 +1,16 @@
+import asyncio
+import collections
+import heapq
+import itertools
 import logging
 
-from functools import total_ordering
-from queue import PriorityQueue
-
 from polyswarmartifact import ArtifactType
 
 logger = logging.getLogger(__name__)  # Initialize logger
 
+# Python 3.12+ can start a task eagerly, running it inline up to its first real suspension
+eager_task_factory = getattr(asyncio, 'eager_task_factory', None)
+
 
 class Callback(object):
     """
@@ -16,9 +20,20 @@ class Callback(object):
     Note:
         Classes which extend `Callback` are expected to impliment the
         `run` method.
+
+        Subclasses whose registered functions are independent of each other can set `concurrent` to run them
+        concurrently rather than one after another in registration order. Each function is scheduled as a task on
+        the running loop, started eagerly where the interpreter supports it (3.12+) so a function that completes
+        without awaiting runs inline. Only this fan-out is eager, other tasks on the loop are scheduled as usual.
+        A lone registered function is still awaited directly. If any function raises, the others still running are
+        cancelled and the first exception propagates, matching the serial path which stops at the first failure.
     """
+    __slots__ = ('_callback0', 'cbs')
+    concurrent = False
 
     def __init__(self):
+        # Most callbacks only ever have one function registered, keep the first one out of the list
+        self._callback0 = None
         self.cbs = []
 
     def register(self, f):
@@ -28,7 +43,10 @@ class Callback(object):
         Args:
             f (function): Function to register.
         """
-        self.cbs.append(f)
+        if self._callback0 is None and not self.cbs:
+            self._callback0 = f
+        else:
+            self.cbs.append(f)
 
     def remove(self, f):
         """
@@ -37,7 +55,10 @@ class Callback(object):
         Args:
             f (function): Function to remove.
         """
-        self.cbs.remove(f)
+        if self._callback0 is not None and self._callback0 == f:
+            self._callback0 = self.cbs.pop(0) if self.cbs else None
+        else:
+            self.cbs.remove(f)
 
     async def run(self, *args, **kwargs):
         """
@@ -46,48 +67,108 @@ class Callback(object):
         Returns:
             results (List[any]): Results returned from the callback functions
         """
-        results = []
-        for cb in self.cbs:
+        # cbs is only populated once _callback0 is taken, so a single function always takes the direct path below
+        if self.concurrent and self.cbs:
+            return await self._run_concurrent(*args, **kwargs)
+
+        results = None
+        callback0 = self._callback0
+        if callback0 is not None:
+            local_ret = await callback0(*args, **kwargs)
+            if local_ret is not None:
+                results = [local_ret]
+
+        cbs = self.cbs
+        for cb in cbs:
             local_ret = await cb(*args, **kwargs)
             if local_ret is not None:
+                if results is None:
+                    results = []
                 results.append(local_ret)
 
-        if results:
+        if results is None:
+            return []
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info('%s callback results', type(self).__name__, extra={'extra': results})
+
+        return results
+
+    async def _run_concurrent(self, *args, **kwargs):
+        """
+        Run all of the registered callback functions concurrently, expects at least two to be registered.
+
+        Returns:
+            results (List[any]): Results returned from the callback functions, in registration order
+        """
+        cbs = [self._callback0] + self.cbs
+        coros = []
+        try:
+            for cb in cbs:
+                coros.append(cb(*args, **kwargs))
+        except Exception:
+            # Don't leave the coroutines we already created un-awaited
+            for coro in coros:
+                coro.close()
+            raise
+
+        loop = asyncio.get_event_loop()
+        if eager_task_factory is not None:
+            tasks = [eager_task_factory(loop, coro) for coro in coros]
+        else:
+            tasks = [loop.create_task(coro) for coro in coros]
+        try:
+            results = [r for r in await asyncio.gather(*tasks) if r is not None]
+        except BaseException:
+            # Stop the functions still running and collect their outcomes, so none are left running unobserved
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+        if results and logger.isEnabledFor(logging.INFO):
             logger.info('%s callback results', type(self).__name__, extra={'extra': results})
 
         return results
 
 
 # Create these subclasses so we can document the parameters to each callback
+# The overrides only fix the argument order and hand back the coroutine from Callback.run, they are intentionally not
+# coroutines themselves so a dispatch doesn't pay for a second coroutine frame
 class OnRunCallback(Callback):
     """Called upon entering the event loop for the first time, use for initialization"""
+    __slots__ = ()
 
-    async def run(self, chain):
+    def run(self, chain):
         """Run the registered callbacks
 
         Args:
             chain (str): Chain event received on
         """
-        return await super().run(chain)
+        return super().run(chain)
 
 
 class OnNewBlockCallback(Callback):
     """Called upon receiving a new block, scheduled events triggered separately"""
+    __slots__ = ()
+    concurrent = True
 
-    async def run(self, number, chain):
+    def run(self, number, chain):
         """Run the registered callbacks
 
         Args:
             number (int): Block number received
             chain (str): Chain event received on
         """
-        return await super().run(number, chain)
+        return super().run(number, chain)
 
 
 class OnNewBountyCallback(Callback):
     """Called upon receiving a new bounty"""
+    __slots__ = ()
+    concurrent = True
 
-    async def run(self, guid, artifact_type, author, amount, uri, expiration, metadata, block_number, txhash, chain):
+    def run(self, guid, artifact_type, author, amount, uri, expiration, metadata, block_number, txhash, chain):
         """Run the registered callbacks
 
         Args:
@@ -102,14 +183,15 @@ class OnNewBountyCallback(Callback):
             txhash (str): Transaction hash which caused the event
             chain (str): Chain event received on
         """
-        return await super().run(guid, ArtifactType.from_string(artifact_type), author, amount, uri, expiration,
-                                 metadata, block_number, txhash, chain)
+        return super().run(guid, ArtifactType.from_string(artifact_type), author, amount, uri, expiration,
+                           metadata, block_number, txhash, chain)
 
 
 class OnNewAssertionCallback(Callback):
     """Called upon receiving a new assertion"""
+    __slots__ = ()
 
-    async def run(self, bounty_guid, author, index, bid, mask, commitment, block_number, txhash, chain):
+    def run(self, bounty_guid, author, index, bid, mask, commitment, block_number, txhash, chain):
         """Run the registered callbacks
 
         Args:
@@ -122,13 +204,14 @@ class OnNewAssertionCallback(Callback):
             txhash (str): Transaction hash which caused the event
             chain (str): Chain event received on
         """
-        return await super().run(bounty_guid, author, index, bid, mask, commitment, block_number, txhash, chain)
+        return super().run(bounty_guid, author, index, bid, mask, commitment, block_number, txhash, chain)
 
 
 class OnRevealAssertionCallback(Callback):
     """Called upon receiving a new assertion reveal"""
+    __slots__ = ()
 
-    async def run(self, bounty_guid, author, index, nonce, verdicts, metadata, block_number, txhash, chain):
+    def run(self, bounty_guid, author, index, nonce, verdicts, metadata, block_number, txhash, chain):
         """Run the registered callbacks
 
         Args:
@@ -142,13 +225,14 @@ class OnRevealAssertionCallback(Callback):
             txhash (str): Transaction hash which caused the event
             chain (str): Chain event received on
         """
-        return await super().run(bounty_guid, author, index, nonce, verdicts, metadata, block_number, txhash, chain)
+        return super().run(bounty_guid, author, index, nonce, verdicts, metadata, block_number, txhash, chain)
 
 
 class OnNewVoteCallback(Callback):
     """Called upon receiving a new arbiter vote"""
+    __slots__ = ()
 
-    async def run(self, bounty_guid, votes, voter, block_number, txhash, chain):
+    def run(self, bounty_guid, votes, voter, block_number, txhash, chain):
         """Run the registered callbacks
 
         Args:
@@ -159,13 +243,14 @@ class OnNewVoteCallback(Callback):
             txhash (str): Transaction hash which caused the event
             chain (str): Chain event received on
         """
-        return await super().run(bounty_guid, votes, voter, block_number, txhash, chain)
+        return super().run(bounty_guid, votes, voter, block_number, txhash, chain)
 
 
 class OnQuorumReachedCallback(Callback):
     """Called upon a bounty reaching quorum"""
+    __slots__ = ()
 
-    async def run(self, bounty_guid, block_number, txhash, chain):
+    def run(self, bounty_guid, block_number, txhash, chain):
         """Run the registered callbacks
 
         Args:
@@ -174,13 +259,14 @@ class OnQuorumReachedCallback(Callback):
             txhash (str): Transaction hash which caused the event
             chain (str): Chain event received on
         """
-        return await super().run(bounty_guid, block_number, txhash, chain)
+        return super().run(bounty_guid, block_number, txhash, chain)
 
 
 class OnSettledBountyCallback(Callback):
     """Called upon a bounty being settled"""
+    __slots__ = ()
 
-    async def run(self, bounty_guid, settler, payout, block_number, txhash, chain):
+    def run(self, bounty_guid, settler, payout, block_number, txhash, chain):
         """Run the registered callbacks
 
         Args:
@@ -191,13 +277,14 @@ class OnSettledBountyCallback(Callback):
             txhash (str): Transaction hash which caused the event
             chain (str): Chain event received on
         """
-        return await super().run(bounty_guid, settler, payout, block_number, txhash, chain)
+        return super().run(bounty_guid, settler, payout, block_number, txhash, chain)
 
 
 class OnDeprecatedCallback(Callback):
     """Called upon the BountyRegistry contract being deprecated"""
+    __slots__ = ()
 
-    async def run(self, rollover, block_number, txhash, chain):
+    def run(self, rollover, block_number, txhash, chain):
         """Run the registered callbacks
 
         Args:
@@ -206,13 +293,14 @@ class OnDeprecatedCallback(Callback):
             txhash (str): Transaction hash which caused the event
             chain (str): Chain event received on
         """
-        return await super().run(rollover, block_number, txhash, chain)
+        return super().run(rollover, block_number, txhash, chain)
 
 
 class OnInitializedChannelCallback(Callback):
     """Called upon a channel being initialized"""
+    __slots__ = ()
 
-    async def run(self, guid, ambassador, expert, multi_signature, block_number, txhash):
+    def run(self, guid, ambassador, expert, multi_signature, block_number, txhash):
         """Run the registered callbacks
 
         Args:
@@ -225,16 +313,40 @@ class OnInitializedChannelCallback(Callback):
             chain (str): Chain event received on
         """
 
-        return await super().run(guid, ambassador, expert, multi_signature, block_number, txhash)
+        return super().run(guid, ambassador, expert, multi_signature, block_number, txhash)
 
 
 class Schedule(object):
     """
-    Generic Schedule class. Uses a PriorityQueue data structure to store Events.
+    Generic Schedule class. Stores Events ordered by block.
+
+    Events are almost always scheduled in non-decreasing block order, so those go to a FIFO which needs no sifting.
+    Anything scheduled out of order falls back to a heap, and reads take whichever of the two heads is lower.
+
+    Note:
+        Not thread safe, the schedule is only accessed from the event loop.
     """
 
     def __init__(self):
-        self.queue = PriorityQueue()
+        # Entries are (block, sequence, event), so ties on block are broken by insertion order with an int compare
+        # and events never need to be compared with each other
+        self._fifo = collections.deque()
+        self._heap = []
+        self._sequence = itertools.count()
+
+    def _front(self):
+        """
+        Return the container holding the lowest entry, or None if the schedule is empty.
+        """
+        fifo = self._fifo
+        heap = self._heap
+        if not heap:
+            return fifo if fifo else None
+
+        if not fifo or heap[0] < fifo[0]:
+            return heap
+
+        return fifo
 
     def empty(self):
         """
@@ -243,7 +355,7 @@ class Schedule(object):
         Returns:
             boolean: Is the queue empty.
         """
-        return self.queue.empty()
+        return not self._fifo and not self._heap
 
     def peek(self):
         """
@@ -252,32 +364,51 @@ class Schedule(object):
         Returns:
             (block, event): Tuple at the front of the queue if the queue is full, else `None`.
         """
-        return self.queue.queue[0] if self.queue.queue else None
+        front = self._front()
+        if front is None:
+            return None
+
+        block, _, event = front[0]
+        return block, event
 
     def get(self):
         """
         Pop the lowest valued block in the queue.
 
         Returns:
-            (block, event): The lowest valued block in the PriorityQueue.
+            (block, event): The lowest valued block in the queue.
         """
-        return self.queue.get()
+        front = self._front()
+        if front is None:
+            raise IndexError('get from empty Schedule')
+
+        if front is self._heap:
+            block, _, event = heapq.heappop(self._heap)
+        else:
+            block, _, event = self._fifo.popleft()
+
+        return block, event
 
     def put(self, block, event):
         """
-        Add a tuple (block, event) to the PriorityQueue. Block signifies the priority of the event.
+        Add a tuple (block, event) to the queue. Block signifies the priority of the event.
         """
-        self.queue.put((block, event))
+        entry = (block, next(self._sequence), event)
+        fifo = self._fifo
+        if not fifo or fifo[-1][0] <= block:
+            fifo.append(entry)
+        else:
+            heapq.heappush(self._heap, entry)
 
 
-@total_ordering
 class Event(object):
     """
-    Generic Event class. Stores GUID and can compare for equality and order Events.
+    Generic Event class. Stores GUID and can compare for equality.
 
     Args:
         guid (str, None): GUID of the event.
     """
+    __slots__ = ('guid',)
 
     def __init__(self, guid):
         self.guid = guid
@@ -285,9 +416,6 @@ class Event(object):
     def __eq__(self, other):
         return self.guid == other.guid
 
-    def __lt__(self, other):
-        return self.guid < other.guid
-
 
 class RevealAssertion(Event):
     """An assertion scheduled to be publically revealed
@@ -299,6 +427,7 @@ class RevealAssertion(Event):
         verdicts (List[bool]): List of verdicts for each artifact in the bounty
         metadata (str): Optional metadata
     """
+    __slots__ = ('index', 'nonce', 'verdicts', 'metadata')
 
     def __init__(self, guid, index, nonce, verdicts, metadata):
         """Initialize a reveal secret assertion event"""
@@ -311,8 +440,9 @@ class RevealAssertion(Event):
 
 class OnRevealAssertionDueCallback(Callback):
     """Called when an assertion is needing to be revealed"""
+    __slots__ = ()
 
-    async def run(self, bounty_guid, index, nonce, verdicts, metadata, chain):
+    def run(self, bounty_guid, index, nonce, verdicts, metadata, chain):
         """Run the registered callbacks
 
         Args:
@@ -323,7 +453,7 @@ class OnRevealAssertionDueCallback(Callback):
             metadata (str): Optional metadata
             chain (str): Chain event received on
         """
-        return await super().run(bounty_guid, index, nonce, verdicts, metadata, chain)
+        return super().run(bounty_guid, index, nonce, verdicts, metadata, chain)
 
 
 class VoteOnBounty(Event):
@@ -333,6 +463,7 @@ class VoteOnBounty(Event):
         votes (List[bool]): List of votes for each artifact in the bounty
         valid_bloom (bool): Is the bloom filter submitted with the bounty valid
     """
+    __slots__ = ('votes', 'valid_bloom')
 
     def __init__(self, guid, votes, valid_bloom):
         """Initialize a vote event"""
@@ -343,8 +474,9 @@ class VoteOnBounty(Event):
 
 class OnVoteOnBountyDueCallback(Callback):
     """Called when a bounty is needing to be voted on"""
+    __slots__ = ()
 
-    async def run(self, bounty_guid, votes, valid_bloom, chain):
+    def run(self, bounty_guid, votes, valid_bloom, chain):
         """Run the registered callbacks
 
         Args:
@@ -353,7 +485,7 @@ class OnVoteOnBountyDueCallback(Callback):
             valid_bloom (bool): Is the bloom filter submitted with the bounty valid
             chain (str): Chain event received on
         """
-        return await super().run(bounty_guid, votes, valid_bloom, chain)
+        return super().run(bounty_guid, votes, valid_bloom, chain)
 
 
 class SettleBounty(Event):
@@ -361,6 +493,7 @@ class SettleBounty(Event):
      Args:
         guid (str): GUID of the bounty being asserted on
     """
+    __slots__ = ()
 
     def __init__(self, guid):
         """Initialize an settle bounty event
@@ -370,15 +503,16 @@ class SettleBounty(Event):
 
 class OnSettleBountyDueCallback(Callback):
     """Called when a bounty is needing to be settled"""
+    __slots__ = ()
 
-    async def run(self, bounty_guid, chain):
+    def run(self, bounty_guid, chain):
         """Run the registered callbacks
 
         Args:
             bounty_guid (str): GUID of the bounty being voted on
             chain (str): Chain event received on
         """
-        return await super().run(bounty_guid, chain)
+        return super().run(bounty_guid, chain)
 
 
 class WithdrawStake(Event):
@@ -387,6 +521,7 @@ class WithdrawStake(Event):
     Args:
         amount (int): Amount to withdraw from stake
     """
+    __slots__ = ('amount',)
 
     def __init__(self, amount):
         super().__init__(None)
@@ -395,12 +530,13 @@ class WithdrawStake(Event):
 
 class OnWithdrawStakeDueCallback(Callback):
     """Called when a an arbiter needs to withdraw stake (due to deprecation)"""
+    __slots__ = ()
 
-    async def run(self, amount, chain):
+    def run(self, amount, chain):
         """Run the registered callbacks
 
         Args:
             amount (int): Amount to withdraw
             chain (str): Chain event received on
         """
-        return await super().run(amount, chain)
+        return super().run(amount, chain)
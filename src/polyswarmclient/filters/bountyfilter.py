@@ -23,19 +23,106 @@ def split_filter(ctx, param, value):
     result = []
     for item in value:
         # Split only the first:
-        kv = item.split(':', 1)
-        if len(kv) != 2:
+        key, sep, val = item.partition(':')
+        if not sep:
             raise click.BadParameter('Accept and exclude arguments must be formatted `key:value`')
 
-        result.append(Filter(kv[0], FilterComparison.EQ, kv[1]))
+        result.append(Filter(key, FilterComparison.EQ, val))
     return result
 
 
+def index_filters(filters):
+    """ Split filters into an index of EQ filters and a list of everything else
+
+    Filters that override `Filter.filter` are never indexed, so their own matching always runs.
+
+    Args:
+        filters (list[Filter]): Filters to index
+
+    Returns:
+        (dict[str, set[str]], list[Filter]): Target values of EQ filters keyed by metadata key, and the other filters
+    """
+    eq_index = {}
+    other = []
+    for f in filters:
+        if f.comparison == FilterComparison.EQ and f.is_stock:
+            eq_index.setdefault(f.key, set()).add(f.target_value)
+        else:
+            other.append(f)
+
+    return eq_index, other
+
+
+def any_match(metadata, eq_index, other):
+    """ Check if any of the indexed filters match the given metadata
+
+    Args:
+        metadata (dict): metadata dict to test
+        eq_index (dict[str, set[str]]): Target values of EQ filters keyed by metadata key
+        other (list[Filter]): Filters that are not in the EQ index
+
+    Returns:
+        (bool): True if any filter matches
+    """
+    if not isinstance(metadata, dict):
+        return False
+
+    for key, values in eq_index.items():
+        value = metadata.get(key)
+        if value is not None and str(value) in values:
+            return True
+
+    return any(f.filter(metadata) for f in other)
+
+
+def match_all(metadata_list, eq_index, other):
+    """ Check which entries of a metadata list match any of the indexed filters
+
+    Loops over the filters on the outside so each key and check is looked up once per list rather than once per entry.
+
+    Args:
+        metadata_list (list[dict]): metadata dicts to test
+        eq_index (dict[str, set[str]]): Target values of EQ filters keyed by metadata key
+        other (list[Filter]): Filters that are not in the EQ index
+
+    Returns:
+        (list[bool]): True for each entry that any filter matches
+    """
+    hits = [False] * len(metadata_list)
+    candidates = [(i, m) for i, m in enumerate(metadata_list) if isinstance(m, dict)]
+
+    for key, values in eq_index.items():
+        for i, m in candidates:
+            value = m.get(key)
+            if value is not None and str(value) in values:
+                hits[i] = True
+
+    for f in other:
+        if not f.is_stock:
+            for i, m in candidates:
+                if not hits[i] and f.filter(m):
+                    hits[i] = True
+            continue
+
+        key = f.key
+        check = f.check
+        for i, m in candidates:
+            if not hits[i]:
+                value = m.get(key)
+                if value is not None and check(value):
+                    hits[i] = True
+
+    return hits
+
+
 class BountyFilter(MetadataFilter):
     """ Takes two objects list[Filter], accept and reject
         These dicts are used to filter metadata json blobs.
         Each filter runs against given metadata, and is used to determine if this participant will respond to a bounty
     """
+    __slots__ = ('accept', 'reject', '_has_accept', '_has_reject', '_passthrough', '_accept_eq_index', '_accept_other',
+                 '_reject_eq_index', '_reject_other')
+
     def __init__(self, accept, reject):
         """ Create a new BountyFilter object with an array of Filters and RejectFilters
         Args:
@@ -52,6 +139,14 @@ class BountyFilter(MetadataFilter):
         else:
             self.reject = reject
 
+        self._has_accept = bool(self.accept)
+        self._has_reject = bool(self.reject)
+        self._passthrough = not self._has_accept and not self._has_reject
+
+        # EQ filters (everything from split_filter) become one set lookup per key
+        self._accept_eq_index, self._accept_other = index_filters(self.accept)
+        self._reject_eq_index, self._reject_other = index_filters(self.reject)
+
     def is_allowed(self, metadata):
         """Check metadata against the accept and exclude filters, returning True if it passes all checks
 
@@ -61,20 +156,46 @@ class BountyFilter(MetadataFilter):
         Returns:
             (bool): True if meets the conditions and passes the filter
         """
-        if not self.accept and not self.reject:
+        if self._passthrough:
             return True
 
-        accepted = any([f.filter(metadata) for f in self.accept])
-
-        if self.accept and not accepted:
-            logger.debug('Metadata not accepted. Skipping artifact', extra={'extra': {'metadata': metadata,
-                                                                            'accept': self.accept}})
+        if self._has_accept and not any_match(metadata, self._accept_eq_index, self._accept_other):
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug('Metadata not accepted. Skipping artifact', extra={'extra': {'metadata': metadata,
+                                                                                'accept': self.accept}})
             return False
 
-        rejected = any([f.filter(metadata) for f in self.reject])
-        if self.reject and rejected:
-            logger.debug('Metadata rejected. Skipping artifact', extra={'extra': {'metadata': metadata,
-                                                                        'reject': self.reject}})
+        if self._has_reject and any_match(metadata, self._reject_eq_index, self._reject_other):
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug('Metadata rejected. Skipping artifact', extra={'extra': {'metadata': metadata,
+                                                                            'reject': self.reject}})
             return False
 
         return True
+
+    def filter_batch(self, metadata_list):
+        """Check a list of metadata against the accept and exclude filters, same as calling `is_allowed` on each entry
+
+        Args:
+            metadata_list (list[dict]): metadata dicts to test, one per artifact
+
+        Returns:
+            (list[bool]): True for each entry that meets the conditions and passes the filter
+        """
+        # A subclass with its own is_allowed gets exactly that, one call per entry
+        if type(self).is_allowed is not BountyFilter.is_allowed:
+            return super().filter_batch(metadata_list)
+
+        if self._passthrough:
+            return [True] * len(metadata_list)
+
+        if self._has_accept:
+            allowed = match_all(metadata_list, self._accept_eq_index, self._accept_other)
+        else:
+            allowed = [True] * len(metadata_list)
+
+        if self._has_reject:
+            rejected = match_all(metadata_list, self._reject_eq_index, self._reject_other)
+            allowed = [a and not r for a, r in zip(allowed, rejected)]
+
+        return allowed
@@ -7,6 +7,8 @@ logger = logging.getLogger(__name__)
 
 
 class ConfidenceModifier(MetadataFilter):
+    __slots__ = ('favor', 'penalize')
+
     def __init__(self, favor, penalize):
         """ Create a new BountyFilter object with an array of Filters and RejectFilters
         Args:
@@ -37,17 +39,19 @@ class ConfidenceModifier(MetadataFilter):
         if not self.favor and not self.penalize:
             return confidence
 
-        favored = any([f.filter(metadata) for f in self.favor])
+        favored = any(f.filter(metadata) for f in self.favor)
 
-        penalized = any([f.filter(metadata) for f in self.penalize])
+        penalized = any(f.filter(metadata) for f in self.penalize)
 
         if favored and not penalized:
-            logger.debug('Increasing confidence for favored value %s', json.dumps(metadata),
-                         extra={'extra': self.favor})
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug('Increasing confidence for favored value %s', json.dumps(metadata),
+                             extra={'extra': self.favor})
             return confidence * 1.2
         elif penalized and not favored:
-            logger.debug('Decreasing confidence for penalized value %s', json.dumps(metadata),
-                         extra={'extra': self.penalize})
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug('Decreasing confidence for penalized value %s', json.dumps(metadata),
+                             extra={'extra': self.penalize})
             return confidence * .8
         else:
             return confidence
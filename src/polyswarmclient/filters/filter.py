@@ -1,5 +1,7 @@
+import click
 import enum
 import logging
+import operator
 import re
 
 from polyswarmartifact.schema import Bounty
@@ -31,7 +33,10 @@ def parse_filters(ctx, param, value):
         if not response.get(filter_type, None):
             response[filter_type] = []
 
-        response[filter_type].append(Filter(key, comparison, target_value))
+        try:
+            response[filter_type].append(Filter(key, comparison, target_value))
+        except re.error as e:
+            raise click.BadParameter(f'Invalid regex {target_value!r} for filter on {key}: {e}') from e
 
     return response
 
@@ -53,17 +58,74 @@ class FilterComparison(enum.Enum):
 
     @staticmethod
     def from_string(value):
-        for name, member in FilterComparison.__members__.items():
-            if member.value == value:
-                return FilterComparison[name]
+        return _COMPARISON_BY_VALUE.get(value)
+
+
+_COMPARISON_BY_VALUE = {member.value: member for member in FilterComparison}
+
+_NUMERIC_OPS = {
+    FilterComparison.GT: operator.gt,
+    FilterComparison.GTE: operator.ge,
+    FilterComparison.LT: operator.lt,
+    FilterComparison.LTE: operator.le,
+}
+
+_STRING_OPS = {
+    FilterComparison.EQ: operator.eq,
+    FilterComparison.CONTAINS: operator.contains,
+    FilterComparison.STARTS_WITH: str.startswith,
+    FilterComparison.ENDS_WITH: str.endswith,
+}
+
+
+def compile_check(comparison, target_value):
+    """ Resolve a comparison and target value into a single callable that tests a metadata value
+
+    Any casting or compiling of the target is done once here, rather than on every metadata check.
+
+    Args:
+        comparison (FilterComparison): Type of comparison
+        target_value (str): Str representation of the target value
+
+    Returns: (callable) Function that takes a metadata value and returns True if it matches
+    """
+    op = _NUMERIC_OPS.get(comparison)
+    if op is not None:
+        try:
+            target_number = float(target_value)
+        except ValueError:
+            target_number = None
+
+        def number_check(value):
+            try:
+                if target_number is not None:
+                    return op(float(value), target_number)
+            except ValueError:
+                pass
+
+            logger.warning('Using integer specific %s comparison, but have non-integer value %s or target %s',
+                           comparison, value, target_value)
+            return False
+
+        return number_check
+
+    op = _STRING_OPS.get(comparison)
+    if op is not None:
+        return lambda value: op(str(value), target_value)
+
+    if comparison == FilterComparison.REGEX:
+        pattern = re.compile(target_value)
+        return lambda value: pattern.search(str(value)) is not None
 
-        return None
+    return lambda value: False
 
 
 class Filter:
     """ Filter some metadata value
 
     """
+    __slots__ = ('key', 'comparison', 'target_value', '_check')
+
     def __init__(self, key, comparison, target_value):
         """ Create a new Filter
 
@@ -71,10 +133,15 @@ class Filter:
             key (str): Key name for the metadata field being filtered
             comparison (FilterComparison): Type of comparison
             target_value (str): Str representation of the target value
+
+        Raises:
+            re.error: If comparison is REGEX and target_value is not a valid regular expression
         """
         self.key = key
         self.comparison = comparison
         self.target_value = target_value
+        # Invalid patterns raise re.error here, rather than on the first metadata check
+        self._check = compile_check(comparison, target_value)
 
     def __eq__(self, other):
         return isinstance(other, Filter) \
@@ -87,6 +154,19 @@ class Filter:
                                                                          self.comparison,
                                                                          self.target_value)
 
+    @property
+    def check(self):
+        """ Compiled check for this filter's comparison and target, takes a metadata value and returns True on a match
+
+        Only equivalent to `filter` on the value when `filter` is not overridden, see `is_stock`
+        """
+        return self._check
+
+    @property
+    def is_stock(self):
+        """ True unless a subclass overrides `filter`, so batch matching can skip the per-entry method call """
+        return type(self).filter is Filter.filter
+
     def number_check(self, value):
         """ Check a value as a number with GT, GTE, LT, or LTE comparisons
 
@@ -96,21 +176,7 @@ class Filter:
         Returns: (bool) returns True if comparison matches
 
         """
-        try:
-            match = False
-            if self.comparison == FilterComparison.GT:
-                match = float(value) > float(self.target_value)
-            elif self.comparison == FilterComparison.GTE:
-                match = float(value) >= float(self.target_value)
-            elif self.comparison == FilterComparison.LT:
-                match = float(value) < float(self.target_value)
-            elif self.comparison == FilterComparison.LTE:
-                match = float(value) <= float(self.target_value)
-            return match
-        except ValueError:
-            logger.warning('Using integer specific %s comparison, but have non-integer value %s or target %s',
-                           self.comparison, value, self.target_value)
-            return False
+        return self.comparison in _NUMERIC_OPS and self._check(value)
 
     def string_check(self, value):
         """ Check a value as a string with EQ, CONTAINS, STARTS_WITH, ENDS_WITH, and REGEX comparisons
@@ -121,19 +187,7 @@ class Filter:
         Returns: (bool) returns True if comparison matches
 
         """
-        match = False
-        if self.comparison == FilterComparison.EQ:
-            match = str(value) == self.target_value
-        elif self.comparison == FilterComparison.CONTAINS:
-            match = self.target_value in str(value)
-        elif self.comparison == FilterComparison.STARTS_WITH:
-            match = str(value).startswith(self.target_value)
-        elif self.comparison == FilterComparison.ENDS_WITH:
-            match = str(value).endswith(self.target_value)
-        elif self.comparison == FilterComparison.REGEX:
-            match = bool(re.search(self.target_value, str(value)))
-
-        return match
+        return self.comparison not in _NUMERIC_OPS and self._check(value)
 
     def filter(self, metadata):
         """ Take some metadata, and matches the given key against the target_value and comparison operator for this filter
@@ -146,14 +200,8 @@ class Filter:
         if metadata is None or not isinstance(metadata, dict):
             return False
 
-        value = metadata.get(self.key, None)
-        if value is None:
-            return False
-
-        if self.comparison in [FilterComparison.GT, FilterComparison.GTE, FilterComparison.LT, FilterComparison.LTE]:
-            return self.number_check(value)
-
-        return self.string_check(value)
+        value = metadata.get(self.key)
+        return value is not None and self._check(value)
 
 
 class MetadataFilter:
@@ -161,6 +209,7 @@ class MetadataFilter:
         These dicts are used to filter metadata json blobs.
         Each filter runs against given metadata, and is used to determine if this participant will respond to a bounty
     """
+    __slots__ = ()
 
     @staticmethod
     def pad_metadata(metadata, min_length):
@@ -172,13 +221,28 @@ class MetadataFilter:
 
         Returns:
             list of metadata dicts, or None values
+
+        Note:
+            Each padded slot is its own empty dict, so a scanner mutating one does not affect the others
         """
-        result = metadata
-        if not metadata or not Bounty.validate(metadata):
-            result = [{}] * min_length
-        elif len(metadata) < min_length:
-            result.extend([{}] * (min_length - len(metadata)))
+        if not metadata or not isinstance(metadata, list) or not Bounty.validate(metadata):
+            result = [{} for _ in range(min_length)]
+        else:
+            diff = min_length - len(metadata)
+            result = metadata + [{} for _ in range(diff)] if diff > 0 else metadata
 
-        logger.debug('Padded result %s:', result)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('Padded result %s:', result)
 
         return result
+
+    def filter_batch(self, metadata_list):
+        """ Check a list of metadata, calling `is_allowed` on each entry
+
+        Args:
+            metadata_list (list[dict]): metadata dicts to test, one per artifact
+
+        Returns:
+            (list[bool]): True for each entry that passes the filter
+        """
+        return [self.is_allowed(metadata) for metadata in metadata_list]
@@ -1,4 +1,5 @@
 import asyncio
+import json
 import logging
 import time
 
@@ -15,6 +16,57 @@ class Liveness:
     last_iteration: int
     average_wait: int
 
+    def json(self):
+        """Get the json representation of this Liveness
+
+        Returns:
+            (str): json string to record
+        """
+        # Both fields are always numbers, whose str() is already valid json
+        return '{{"last_iteration": {}, "average_wait": {}}}'.format(self.last_iteration, self.average_wait)
+
+    @classmethod
+    def from_json(cls, content):
+        """Load a Liveness from its json representation
+
+        Args:
+            content (str): json string read from the liveness record
+
+        Returns:
+            (Liveness): Liveness values from the record
+
+        Raises:
+            LivenessReadError: If the content is not a valid liveness record
+        """
+        try:
+            loaded = json.loads(content)
+        except json.JSONDecodeError:
+            logger.exception('Invalid liveness record')
+            raise LivenessReadError()
+
+        if not is_valid_liveness(loaded):
+            logger.error('Invalid liveness record', extra={'extra': loaded})
+            raise LivenessReadError()
+
+        return cls(**loaded)
+
+
+def is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def is_valid_liveness(loaded):
+    """Check a loaded liveness record has exactly the two numeric fields of Liveness
+
+    Args:
+        loaded: Value loaded from the liveness record json
+
+    Returns:
+        (bool): True if the record is valid
+    """
+    return isinstance(loaded, dict) and len(loaded) == 2 and is_number(loaded.get('last_iteration')) \
+        and is_number(loaded.get('average_wait'))
+
 
 class LivenessCheck(ABC):
     def __init__(self, loop_iteration_threshold=5, average_wait_threshold=10):
@@ -41,10 +93,11 @@ class LivenessCheck(ABC):
 class LivenessRecorder(ABC):
     def __init__(self):
         self.waiting = {}
+        # Sum of the start times in waiting, so the average wait doesn't need to walk every task
+        self.waiting_start_sum = 0
         self.block_number = 0
         self.liveness = Liveness(last_iteration=0, average_wait=0)
         self.waiting_lock = None
-        self.record_lock = None
 
     async def start(self):
         loop = asyncio.get_event_loop()
@@ -52,19 +105,18 @@ class LivenessRecorder(ABC):
         loop.create_task(self.run_liveness_loop())
 
     async def run_liveness_loop(self):
+        """Single writer for the liveness record, writes the latest values once per second"""
         while True:
             await self.advance_loop()
             await asyncio.sleep(1)
 
     async def setup(self):
         self.waiting_lock = asyncio.Lock()
-        self.record_lock = asyncio.Lock()
 
     async def advance_loop(self):
         """The loop is turning, and record the time of the latest iteration"""
-        async with self.record_lock:
-            self.liveness.last_iteration = round(time.time())
-            await self.record()
+        self.liveness.last_iteration = int(time.time())
+        await self.record()
 
     async def add_waiting_task(self, key, start_time):
         """Add some bounty as waiting to be processed.
@@ -76,30 +128,28 @@ class LivenessRecorder(ABC):
         async with self.waiting_lock:
             if key not in self.waiting:
                 self.waiting[key] = start_time
+                self.waiting_start_sum += start_time
 
     async def remove_waiting_task(self, key):
         """Mark a task as done processing"""
         async with self.waiting_lock:
             if key in self.waiting:
-                del self.waiting[key]
+                self.waiting_start_sum -= self.waiting.pop(key)
 
     async def advance_time(self, current_time):
         """ Trigger an update to the average, based on the current time.
         For most cases, this is time in blocks, but it can be any unit
 
+        The new average is written out with the next iteration of the liveness loop, so bursts of updates only cost
+        one write.
+
         Args:
             current_time: time in some units
 
         """
-        time_units = 0
         async with self.waiting_lock:
-            for start_time in self.waiting.values():
-                time_units += current_time - start_time
-        average_wait = time_units / max(len(self.waiting), 1)
-
-        async with self.record_lock:
-            self.liveness.average_wait = average_wait
-            await self.record()
+            time_units = current_time * len(self.waiting) - self.waiting_start_sum
+            self.liveness.average_wait = time_units / max(len(self.waiting), 1)
 
     @abstractmethod
     async def record(self):
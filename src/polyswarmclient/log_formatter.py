@@ -1,7 +1,30 @@
 import logging
-from datetime import datetime
+import time
 from pythonjsonlogger import jsonlogger
 
+# (second, formatted second) of the last timestamp, records mostly arrive within the same second
+_timestamp_cache = (None, None)
+
+
+def format_timestamp(created):
+    """
+    Format a record creation time as an ISO 8601 UTC timestamp with microseconds
+
+    Args:
+        created (float): Seconds since the epoch, as in LogRecord.created
+
+    Returns:
+        (str): Timestamp formatted like '%Y-%m-%dT%H:%M:%S.%fZ'
+    """
+    global _timestamp_cache
+    second = int(created)
+    cached_second, prefix = _timestamp_cache
+    if cached_second != second:
+        prefix = time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(second))
+        _timestamp_cache = (second, prefix)
+
+    return '{}.{:06d}Z'.format(prefix, int((created - second) * 1e6))
+
 
 class ExtraTextFormatter(logging.Formatter):
     """
@@ -15,15 +38,20 @@ class ExtraTextFormatter(logging.Formatter):
         It searches the record dict for some extra keys we use in the client. (specified as extra= in the logger statement)
         If it finds one, it grabs the dict and adds an extra %s arg to record.msg, and the dict value to the record.args tuple.
         """
-        # search for extra keys in the dict.
-        extra = record.__dict__.get('extra')
-        if extra is not None:
-            # Add the extra value to the msg format string and the dict to the tuple
-            record.msg += ': %s'
-            # add extra dict as a tuple
-            record.args = record.args + (extra,)
+        extra = getattr(record, 'extra', None)
+        if extra is None:
+            return super().format(record)
+
+        # Add the extra value to the msg format string and the dict to the args tuple, only while formatting so the
+        # record is left as it was for any other handlers
+        msg, args = record.msg, record.args
+        record.msg = str(msg) + ': %s'
+        record.args = args + (extra,)
+        try:
+            return super().format(record)
+        finally:
+            record.msg, record.args = msg, args
 
-        return super().format(record)
 
 class JSONFormatter(jsonlogger.JsonFormatter):
     """
@@ -35,9 +63,7 @@ class JSONFormatter(jsonlogger.JsonFormatter):
     def add_fields(self, log_record, record, message_dict):
         super(JSONFormatter, self).add_fields(log_record, record, message_dict)
         if not log_record.get('timestamp'):
-            # this doesn't use record.created, so it is slightly off
-            now = datetime.utcnow().strftime('%Y-%m-%dT%H:%M:%S.%fZ')
-            log_record['timestamp'] = now
+            log_record['timestamp'] = format_timestamp(record.created)
         if log_record.get('level'):
             log_record['level'] = log_record['level'].upper()
         else:
@@ -1,17 +1,27 @@
-import aiorwlock
-
-
 class Parameters(object):
-    """Trivial wrapper around a dict but protected via a RWLock to allow updates"""
+    """Trivial wrapper around a dict which allows updates
+
+    Updates never modify the dict in place, they swap in an updated copy. Readers always see a complete set of
+    parameters without needing a lock, even across an update.
+    """
 
     def __init__(self, p):
-        self.rwlock = aiorwlock.RWLock()
-        self.inner = p
+        self.inner = dict(p)
 
     async def update(self, new):
-        async with self.rwlock.writer:
-            self.inner.update(new)
+        self.inner = {**self.inner, **new}
 
     async def get(self, name):
-        async with self.rwlock.reader:
-            return self.inner.get(name)
+        return self.inner.get(name)
+
+    async def get_many(self, *names):
+        """Get several parameters from the same snapshot
+
+        Args:
+            *names (str): Names of the parameters to get
+
+        Returns:
+            (tuple): Parameter values in the order given, None for missing parameters
+        """
+        inner = self.inner
+        return tuple(inner.get(name) for name in names)
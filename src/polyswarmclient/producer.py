@@ -3,6 +3,7 @@ import asyncio
 import dataclasses
 import json
 import logging
+import math
 import time
 
 from typing import Optional, Any, Dict
@@ -15,6 +16,8 @@ logger = logging.getLogger(__name__)
 
 WAIT_TIME = 20
 KEY_TIMEOUT = WAIT_TIME + 10
+# Each bounty being scanned holds a connection while it waits for results
+REDIS_POOL_MAXSIZE = 32
 
 
 @dataclasses.dataclass
@@ -37,7 +40,8 @@ class JobRequest:
         return ArtifactType(self.artifact_type)
 
     def asdict(self):
-        return dataclasses.asdict(self)
+        # Fields are all json primitives or a metadata dict, a shallow copy will do where dataclasses.asdict deep copies
+        return dict(vars(self))
 
 
 @dataclasses.dataclass
@@ -49,7 +53,8 @@ class JobResponse:
     metadata: str
 
     def asdict(self):
-        return dataclasses.asdict(self)
+        # All fields are primitives, there is nothing for dataclasses.asdict to deep copy
+        return dict(vars(self))
 
 
 class Producer:
@@ -58,6 +63,8 @@ class Producer:
         self.client = client
         self.redis_uri = redis_uri
         self.queue = queue
+        # Perf counter workers are scaled on
+        self.result_counter_key = f'{queue}_scan_result_counter'
         self.time_to_post = time_to_post
         self.bounty_filter = bounty_filter
         self.confidence_modifier = confidence_modifier
@@ -67,7 +74,7 @@ class Producer:
     async def start(self):
         if self.rate_limit is not None:
             await self.rate_limit.setup()
-        self.redis = await aioredis.create_redis_pool(self.redis_uri)
+        self.redis = await aioredis.create_redis_pool(self.redis_uri, maxsize=REDIS_POOL_MAXSIZE)
 
     async def scan(self, guid, artifact_type, uri, duration, metadata, chain):
         """Creates a set of jobs to scan all the artifacts at the given URI that are passed via Redis to workers
@@ -87,69 +94,111 @@ class Producer:
         timeout = duration - self.time_to_post
         logger.info(f'Timeout set to {timeout}')
 
-        async def wait_for_result(result_key):
-            try:
-                with await self.redis as redis:
-                    while True:
-                        result = await redis.lpop(result_key)
-                        if result:
-                            break
+        def parse_result(result):
+            # Read the JobResponse fields straight from the decoded json, no need for the dataclass in between
+            response = json.loads(result)
+            index = response['index']
+            # The index comes from the worker, never trust it to address metadata or the results
+            if not 0 <= index < num_artifacts:
+                raise IndexError(f'Artifact index {index} out of range')
 
-                        await asyncio.sleep(1)
+            confidence = response['confidence'] if not self.confidence_modifier \
+                else self.confidence_modifier.modify(metadata[index], response['confidence'])
 
-                    response = JobResponse(**json.loads(result.decode('utf-8')))
+            return index, ScanResult(bit=response['bit'], verdict=response['verdict'], confidence=confidence,
+                                     metadata=response['metadata'])
 
-                    # increase perf counter for autoscaling
-                    q_counter = f'{self.queue}_scan_result_counter'
-                    await redis.incr(q_counter)
-                    confidence = response.confidence if not self.confidence_modifier \
-                        else self.confidence_modifier.modify(metadata[response.index], response.confidence)
-
-                    return response.index, ScanResult(bit=response.bit, verdict=response.verdict, confidence=confidence,
-                                                      metadata=response.metadata)
+        async def wait_for_results(result_key, count, results):
+            """Collect up to count results into the results dict, all waiting on one pooled connection"""
+            try:
+                loop = asyncio.get_event_loop()
+                deadline = loop.time() + timeout
+                with await self.redis as redis:
+                    received = 0
+                    while received < count:
+                        # Block on the server until a worker pushes a result, rather than polling for one. The server
+                        # side timeout tracks the caller's deadline, so a cancelled wait never leaves a BLPOP blocking
+                        # the pooled connection much longer (0 would block it forever)
+                        result = await redis.blpop(result_key, timeout=max(math.ceil(deadline - loop.time()), 1))
+                        if result is None:
+                            return
+
+                        batch = [result[1]]
+                        if received + 1 < count:
+                            # Take whatever else has arrived meanwhile in the same round trip
+                            tr = redis.multi_exec()
+                            pending = tr.lrange(result_key, 0, -1)
+                            tr.delete(result_key)
+                            await tr.execute()
+                            batch.extend(await pending)
+
+                        received += len(batch)
+                        for result in batch:
+                            try:
+                                index, scan_result = parse_result(result)
+                                results[index] = scan_result
+                            except (AttributeError, IndexError, ValueError, KeyError, TypeError):
+                                logger.exception('Received invalid response from worker')
             except aioredis.errors.ReplyError:
                 logger.exception('Redis out of memory')
+            except aioredis.errors.MultiExecError:
+                logger.exception('Redis transaction failed')
             except aioredis.errors.ConnectionForcedCloseError:
                 logger.exception('Redis connection closed')
             except OSError:
                 logger.exception('Redis connection down')
-            except (AttributeError, ValueError, KeyError):
-                logger.exception('Received invalid response from worker')
-                return None
 
         num_artifacts = len(await self.client.list_artifacts(uri))
+        if not num_artifacts:
+            return []
+
         # Fill out metadata to match same number of artifacts
         metadata = MetadataFilter.pad_metadata(metadata, num_artifacts)
 
+        if self.bounty_filter is None:
+            allowed = [True] * num_artifacts
+        else:
+            allowed = self.bounty_filter.filter_batch(metadata)
+
+        # Fields of the JobRequest shared by every artifact in the bounty, only index and metadata vary. These are
+        # encoded once, and each job splices its own fields in before the closing brace
+        base_job = {
+            'polyswarmd_uri': self.client.polyswarmd_uri,
+            'guid': guid,
+            'uri': uri,
+            'artifact_type': artifact_type.value,
+            'duration': duration,
+            'chain': chain,
+            'ts': int(time.time()),
+        }
+
+        job_prefix = json.dumps(base_job)[:-1]
+
         jobs = []
         for i in range(num_artifacts):
-            if (self.bounty_filter is None or self.bounty_filter.is_allowed(metadata[i])) \
-             and (self.rate_limit is None or await self.rate_limit.use()):
-                job = JobRequest(polyswarmd_uri=self.client.polyswarmd_uri,
-                                 guid=guid,
-                                 index=i,
-                                 uri=uri,
-                                 artifact_type=artifact_type.value,
-                                 duration=duration,
-                                 metadata=metadata[i],
-                                 chain=chain,
-                                 ts=int(time.time()))
-                jobs.append(json.dumps(job.asdict()))
+            if allowed[i] and (self.rate_limit is None or await self.rate_limit.use()):
+                jobs.append(f'{job_prefix}, "index": {i}, "metadata": {json.dumps(metadata[i])}}}')
 
         if jobs:
             try:
                 await self.redis.rpush(self.queue, *jobs)
 
-                key = '{}_{}_{}_results'.format(self.queue, guid, chain)
-                results = await asyncio.gather(*[asyncio.wait_for(wait_for_result(key), timeout=timeout) for _ in jobs],
-                                               return_exceptions=True)
-                # In the event of filter or rate limit, the index (r[0]) will not have a value in the dict
-                results = {r[0]: r[1] for r in results if r is not None and not isinstance(r, Exception)}
+                key = f'{self.queue}_{guid}_{chain}_results'
+                # In the event of filter or rate limit, the index will not have a value in the dict
+                results = {}
+                try:
+                    await asyncio.wait_for(wait_for_results(key, len(jobs), results), timeout=timeout)
+                except asyncio.TimeoutError:
+                    pass
+
                 if len(results.keys()) < num_artifacts:
                     logger.error('Exception handling guid %s', guid)
 
-                # Age off old result keys
-                await self.redis.expire(key, KEY_TIMEOUT)
+                # Increase perf counter for autoscaling once for the batch, and age off old result keys, in one trip
+                pipe = self.redis.pipeline()
+                pipe.incrby(self.result_counter_key, len(results))
+                pipe.expire(key, KEY_TIMEOUT)
+                await pipe.execute()
 
                 # Any missing responses will be replaced inline with an empty scan result
                 return [results.get(i, ScanResult()) for i in range(num_artifacts)]
@@ -157,6 +206,8 @@ class Producer:
                 logger.exception('Redis connection down')
             except aioredis.errors.ReplyError:
                 logger.exception('Redis out of memory')
+            except aioredis.errors.PipelineError:
+                logger.exception('Redis pipeline failed')
             except aioredis.errors.ConnectionForcedCloseError:
                 logger.exception('Redis connection closed')
 
@@ -1,11 +1,25 @@
 import aioredis
 import datetime
+import hashlib
 import logging
 
 from polyswarmclient.ratelimit.abstractratelimit import AbstractRateLimit
 
 logger = logging.getLogger(__name__)
 
+# Give an hour extra before expiring, in case someone wants to take a look manually
+DAILY_KEY_EXPIRATION = 60 * 60 * 25
+
+# Increment the daily counter, and start its expiration on the first use, in a single round trip
+INCR_DAILY_SCRIPT = """
+local value = redis.call('INCR', KEYS[1])
+if value == 1 then
+    redis.call('EXPIRE', KEYS[1], ARGV[1])
+end
+return value
+"""
+INCR_DAILY_SCRIPT_SHA = hashlib.sha1(INCR_DAILY_SCRIPT.encode('utf-8')).hexdigest()
+
 
 class RedisDailyRateLimit(AbstractRateLimit):
     """ Third Party limitation where redis is used to track a daily scan limit.
@@ -18,14 +32,41 @@ class RedisDailyRateLimit(AbstractRateLimit):
         self.redis = None
         self.queue = queue
         self.limit = limit if limit is None else int(limit)
+        # The key only changes once a day, keep it along with the day it was built for
+        self.daily_key = None
+        self.daily_key_ordinal = None
 
     def get_daily_key(self):
-        date = datetime.date.today().strftime('%Y-%m-%d')
-        return f'{self.queue}:{date}'
+        today = datetime.date.today()
+        ordinal = today.toordinal()
+        if ordinal != self.daily_key_ordinal:
+            self.daily_key = f'{self.queue}:{today.strftime("%Y-%m-%d")}'
+            self.daily_key_ordinal = ordinal
+
+        return self.daily_key
 
     async def setup(self):
         self.redis = await aioredis.create_redis_pool(self.redis_uri)
 
+    async def incr_daily(self, key):
+        """
+        Increment the counter for the given daily key, setting it to expire when first created
+
+        Args:
+            key (str): daily key to increment
+
+        Returns:
+            (int): Counter value after the increment
+        """
+        try:
+            return await self.redis.evalsha(INCR_DAILY_SCRIPT_SHA, keys=[key], args=[DAILY_KEY_EXPIRATION])
+        except aioredis.errors.ReplyError as e:
+            # Redis hasn't cached the script yet (or lost it on restart), EVAL sends it and caches it for next time
+            if not str(e).startswith('NOSCRIPT'):
+                raise
+
+            return await self.redis.eval(INCR_DAILY_SCRIPT, keys=[key], args=[DAILY_KEY_EXPIRATION])
+
     async def use(self, *args, **kwargs):
         """
         Keep track of use by incrementing a counter for the current date
@@ -39,11 +80,7 @@ class RedisDailyRateLimit(AbstractRateLimit):
 
         key = self.get_daily_key()
         try:
-            value = await self.redis.incr(key)
-            if value == 1:
-                # Give an hour extra before expiring, in case someone wants to take a look manually
-                await self.redis.expire(key, 60 * 60 * 25)
-
+            value = await self.incr_daily(key)
             if value > self.limit:
                 logger.warning("Reached daily limit of %s with %s total attempts", self.limit, value)
                 return False
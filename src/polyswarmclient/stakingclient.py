@@ -11,6 +11,7 @@ logger = logging.getLogger(__name__)
 class StakeDepositTransaction(AbstractTransaction):
     def __init__(self, client, amount):
         self.amount = amount
+        self.amount_str = str(amount)
         approve = NctApproveVerifier(amount)
         deposit = StakingDepositVerifier(amount)
         super().__init__(client, [approve, deposit])
@@ -20,21 +21,19 @@ class StakeDepositTransaction(AbstractTransaction):
 
     def get_body(self):
         return {
-            'amount': str(self.amount),
+            'amount': self.amount_str,
         }
 
     def has_required_event(self, transaction_events):
-        deposits = transaction_events.get('deposits', [])
-        for deposit in deposits:
-            if deposit.get('value', '') == self.amount:
-                return True
-
-        return False
+        # polyswarmd may report values as ints or strings, compare both as strings
+        deposits = transaction_events.get('deposits', ())
+        return any(str(deposit.get('value', '')) == self.amount_str for deposit in deposits)
 
 
 class StakeWithdrawTransaction(AbstractTransaction):
     def __init__(self, client, amount):
         self.amount = amount
+        self.amount_str = str(amount)
         withdraw = StakingWithdrawVerifier(amount)
         super().__init__(client, [withdraw])
 
@@ -43,22 +42,20 @@ class StakeWithdrawTransaction(AbstractTransaction):
 
     def get_body(self):
         return {
-            'amount': str(self.amount),
+            'amount': self.amount_str,
         }
 
     def has_required_event(self, transaction_events):
-        withdrawals = transaction_events.get('withdrawals', [])
-        for withdrawal in withdrawals:
-            if withdrawal.get('value', '') == self.amount:
-                return True
-
-        return False
+        withdrawals = transaction_events.get('withdrawals', ())
+        return any(str(withdrawal.get('value', '')) == self.amount_str for withdrawal in withdrawals)
 
 
 class StakingClient(object):
     def __init__(self, client):
         self.__client = client
         self.parameters = {}
+        self.total_balance_path = f'/balances/{client.account}/staking/total'
+        self.withdrawable_balance_path = f'/balances/{client.account}/staking/withdrawable'
 
     async def fetch_parameters(self, chain, api_key=None):
         """Get staking parameters from polyswarmd
@@ -84,8 +81,7 @@ class StakingClient(object):
         Returns:
             Response JSON parsed from polyswarmd containing staking balance
         """
-        path = '/balances/{0}/staking/total'.format(self.__client.account)
-        success, result = await self.__client.make_request('GET', path, chain, api_key=api_key)
+        success, result = await self.__client.make_request('GET', self.total_balance_path, chain, api_key=api_key)
         return int(result)
 
     async def get_withdrawable_balance(self, chain, api_key=None):
@@ -97,8 +93,8 @@ class StakingClient(object):
         Returns:
             Response JSON parsed from polyswarmd containing staking balance
         """
-        path = '/balances/{0}/staking/withdrawable'.format(self.__client.account)
-        success, result = await self.__client.make_request('GET', path, chain, api_key=api_key)
+        success, result = await self.__client.make_request('GET', self.withdrawable_balance_path, chain,
+                                                           api_key=api_key)
         return int(result)
 
     async def post_deposit(self, amount, chain, api_key=None):
@@ -111,12 +107,7 @@ class StakingClient(object):
         Returns:
             Response JSON parsed from polyswarmd containing emitted events
         """
-        transaction = StakeDepositTransaction(self.__client, amount)
-        success, results = await transaction.send(chain, api_key=api_key)
-        if not success or 'deposits' not in results:
-            logger.error('Expected deposit, received', extra={'extra': results})
-
-        return results.get('deposits', [])
+        return await self._post_amount(StakeDepositTransaction, 'deposits', amount, chain, api_key=api_key)
 
     async def post_withdraw(self, amount, chain, api_key=None):
         """Post a withdrawal to the staking contract
@@ -128,9 +119,23 @@ class StakingClient(object):
         Returns:
             Response JSON parsed from polyswarmd containing emitted events
         """
-        transaction = StakeWithdrawTransaction(self.__client, amount)
+        return await self._post_amount(StakeWithdrawTransaction, 'withdrawals', amount, chain, api_key=api_key)
+
+    async def _post_amount(self, transaction_class, event_key, amount, chain, api_key=None):
+        """Send a staking transaction for an amount and return the matching events
+
+        Args:
+            transaction_class (type): AbstractTransaction subclass taking (client, amount)
+            event_key (str): Key of the expected events in the transaction results
+            amount (int): The amount to deposit or withdraw
+            chain (str): Which chain to operate on
+            api_key (str): Override default API key
+        Returns:
+            List of events under event_key, empty if the transaction failed
+        """
+        transaction = transaction_class(self.__client, amount)
         success, results = await transaction.send(chain, api_key=api_key)
-        if not success or 'withdrawals' not in results:
-            logger.error('Expected withdrawal, received', extra={'extra': results})
+        if not success or event_key not in results:
+            logger.error('Expected %s, received', event_key, extra={'extra': results})
 
-        return results.get('withdrawals', [])
+        return results.get(event_key, [])
@@ -1,4 +1,5 @@
 import asyncio
+import backoff
 import logging
 from abc import ABCMeta, abstractmethod
 
@@ -6,6 +7,9 @@ from polyswarmclient.utils import exit
 
 logger = logging.getLogger(__name__)
 
+NONCE_BACKOFF_FACTOR = 0.1
+NONCE_BACKOFF_MAX = 8
+
 LOG_MSG_ENGINE_TOO_SLOW = ('PLEASE REVIEW YOUR SCANNING LOGIC. '
                            'Bounty inactive errors indicate that the microengine received the bounty, '
                            'but was unable to respond to the bounty within the time window. '
@@ -110,8 +114,10 @@ class NonceManager:
         # Only check through the end of the waitlist if results exceed it
         return [r for r in range(nonces[0], nonces[-1]) if r not in nonces]
 
+    @backoff.on_predicate(backoff.expo, lambda nonce: nonce is None, factor=NONCE_BACKOFF_FACTOR,
+                          max_value=NONCE_BACKOFF_MAX)
     async def get_nonce(self, ignore_pending):
-        """Get nonce from polswarmd
+        """Get nonce from polswarmd, retrying with jittered exponential backoff until polyswarmd returns one
 
         Args:
             ignore_pending: Do we want the transaction count with a count of pending transactions
@@ -120,14 +126,7 @@ class NonceManager:
                 (int): Nonce
 
         """
-        while True:
-            nonce = await self.client.get_base_nonce(self.chain, ignore_pending)
-            if nonce is not None:
-                break
-
-            await asyncio.sleep(1)
-
-        return nonce
+        return await self.client.get_base_nonce(self.chain, ignore_pending)
 
     async def mark_update_nonce(self):
         """
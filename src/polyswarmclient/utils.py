@@ -1,4 +1,5 @@
 import asyncio
+import json
 import logging
 import os
 import sys
@@ -78,6 +79,7 @@ def configure_event_loop():
 
     # Default executor spawns way too many threads, set this to a reasonable default
     loop.set_default_executor(ThreadPoolExecutor(max_workers=MAX_WORKERS))
+
     asyncio.set_event_loop(loop)
 
 
@@ -107,6 +109,21 @@ def exit(exit_status):
         sys.exit(exit_status)
 
 
+async def read_json(raw_response):
+    """Parse the JSON body of a polyswarmd response
+
+    Parses the raw bytes directly, skipping the charset detection and text decode done by ClientResponse.json
+
+    Args:
+        raw_response (aiohttp.ClientResponse): Response from polyswarmd
+    Returns:
+        Response JSON parsed from polyswarmd
+    Raises:
+        ValueError: If the body is not valid JSON
+    """
+    return json.loads(await raw_response.read())
+
+
 def check_response(response):
     """Check the status of responses from polyswarmd
 
@@ -81,7 +81,7 @@ def main(log, client_log, redis_addr, queue, backend, tasks, download_limit, sca
     loglevel = getattr(logging, log.upper(), None)
     clientlevel = getattr(logging, client_log.upper(), None)
     if not isinstance(loglevel, int) or not isinstance(clientlevel, int):
-        logging.error('invalid log level')
+        logger.error('invalid log level')
         sys.exit(-1)
 
     logger_name, scanner_class = choose_backend(backend)
@@ -1,7 +1,10 @@
+import asyncio
+
 import pytest
 from polyswarmartifact import ArtifactType
 
 from polyswarmclient import events
+from polyswarmclient.utils import configure_event_loop
 
 
 @pytest.mark.asyncio
@@ -37,6 +40,32 @@ async def test_callback():
         await cb.run(4)
 
 
+@pytest.mark.asyncio
+async def test_callback_remove_first():
+    cb = events.Callback()
+
+    async def one_times(x):
+        return x
+
+    async def two_times(x):
+        return 2 * x
+
+    cb.register(one_times)
+    cb.register(two_times)
+    cb.remove(one_times)
+
+    assert await cb.run(2) == [4]
+
+    cb.register(one_times)
+
+    assert await cb.run(2) == [4, 2]
+
+    cb.remove(two_times)
+    cb.remove(one_times)
+
+    assert await cb.run(2) == []
+
+
 @pytest.mark.asyncio
 async def test_on_run_callback():
     cb = events.OnRunCallback()
@@ -79,6 +108,70 @@ async def test_on_new_block_callback():
         await cb.run(number=42, chain='home')
 
 
+@pytest.mark.asyncio
+async def test_concurrent_callback_failure_cancels_others():
+    cb = events.OnNewBlockCallback()
+    cancelled = []
+
+    async def slow(number, chain):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(number)
+            raise
+
+    async def fail(number, chain):
+        raise ValueError('failed')
+
+    cb.register(slow)
+    cb.register(fail)
+
+    with pytest.raises(ValueError):
+        await cb.run(number=42, chain='home')
+
+    assert cancelled == [42]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_callback_only_fan_out_is_eager():
+    cb = events.OnNewBlockCallback()
+    order = []
+
+    async def first(number, chain):
+        order.append('first')
+
+    async def second(number, chain):
+        order.append('second')
+
+    async def other():
+        order.append('other')
+
+    cb.register(first)
+    cb.register(second)
+    asyncio.get_event_loop().create_task(other())
+
+    await cb.run(number=42, chain='home')
+    ran = list(order)
+    await asyncio.sleep(0)
+
+    if events.eager_task_factory is not None:
+        # The callbacks ran inline when started, the task already waiting on the loop was not run early
+        assert ran == ['first', 'second']
+    else:
+        assert ran == ['other', 'first', 'second']
+    assert 'other' in order
+
+
+def test_configure_event_loop_keeps_default_task_factory():
+    configure_event_loop()
+    loop = asyncio.get_event_loop()
+    try:
+        assert loop.get_task_factory() is None
+    finally:
+        loop.close()
+        asyncio.set_event_loop(None)
+
+
 @pytest.mark.asyncio
 async def test_on_new_bounty_callback():
     cb = events.OnNewBountyCallback()
@@ -265,6 +358,19 @@ def test_schedule():
     assert type(s.get()[1]) == events.WithdrawStake
 
 
+def test_schedule_same_block_keeps_insertion_order():
+    s = events.Schedule()
+
+    s.put(1, events.SettleBounty('guid'))
+    s.put(1, events.WithdrawStake(100))
+    s.put(1, events.SettleBounty('another guid'))
+
+    assert type(s.get()[1]) == events.SettleBounty
+    assert type(s.get()[1]) == events.WithdrawStake
+    assert s.get()[1].guid == 'another guid'
+    assert s.empty()
+
+
 @pytest.mark.asyncio
 async def test_on_reveal_assertion_due_callback():
     cb = events.OnRevealAssertionDueCallback()
@@ -329,3 +435,18 @@ async def test_on_settle_bounty_due_callback():
 
     with pytest.raises(TypeError):
         await cb.run(bounty_guid='guid', chain='home')
+
+
+def test_schedule_out_of_order_put():
+    s = events.Schedule()
+
+    s.put(5, events.SettleBounty('5'))
+    s.put(7, events.SettleBounty('7'))
+    s.put(3, events.SettleBounty('3'))
+    s.put(7, events.SettleBounty('7 again'))
+    s.put(6, events.SettleBounty('6'))
+
+    assert s.peek()[0] == 3
+    assert [s.get()[1].guid for _ in range(5)] == ['3', '5', '6', '7', '7 again']
+    assert s.empty()
+    assert s.peek() is None
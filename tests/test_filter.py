@@ -1,3 +1,8 @@
+import click
+import re
+
+import pytest
+
 from polyswarmclient.filters.bountyfilter import BountyFilter, split_filter
 from polyswarmclient.filters.confidencefilter import ConfidenceModifier
 from polyswarmclient.filters.filter import Filter, FilterComparison, parse_filters, MetadataFilter
@@ -22,6 +27,16 @@ def test_pad_fills_none_to_length():
     assert padded == [{}] * 2
 
 
+def test_pad_entries_are_distinct():
+    # arrange
+    metadata = [{'mimetype': 'text/plain'}]
+    # act
+    padded = MetadataFilter.pad_metadata(metadata, 3)
+    padded[1]['mimetype'] = 'text/html'
+    # assert
+    assert padded == [{'mimetype': 'text/plain'}, {'mimetype': 'text/html'}, {}]
+
+
 def test_pad_fills_to_length():
     # arrange
     metadata = [{'mimetype': 'text/plain'}]
@@ -116,6 +131,86 @@ def test_scans_artifact_accepted_match_only_one():
     assert allowed
 
 
+def test_accepted_mixed_comparisons():
+    # arrange
+    bounty_filter = BountyFilter([Filter('mimetype', FilterComparison.EQ, 'text/plain'),
+                                  Filter('mimetype', FilterComparison.CONTAINS, 'pdf')],
+                                 None)
+    # act
+    allowed = bounty_filter.is_allowed({'mimetype': 'application/pdf'})
+    # assert
+    assert allowed
+
+
+def test_excluded_int_value():
+    # arrange
+    bounty_filter = BountyFilter(None, [Filter('filesize', FilterComparison.EQ, '20')])
+    # act
+    allowed = bounty_filter.is_allowed({'filesize': 20})
+    # assert
+    assert not allowed
+
+
+def test_filter_batch_matches_is_allowed():
+    # arrange
+    bounty_filter = BountyFilter([Filter('mimetype', FilterComparison.EQ, 'text/plain'),
+                                  Filter('mimetype', FilterComparison.CONTAINS, 'pdf')],
+                                 [Filter('filesize', FilterComparison.GT, '100')])
+    metadata = [{'mimetype': 'text/plain', 'filesize': 20},
+                {'mimetype': 'application/pdf', 'filesize': 200},
+                {'mimetype': 'application/pdf'},
+                {'mimetype': 'image/png'},
+                {},
+                None]
+    # act
+    allowed = bounty_filter.filter_batch(metadata)
+    # assert
+    assert allowed == [True, False, True, False, False, False]
+    assert allowed == [bounty_filter.is_allowed(m) for m in metadata]
+
+
+def test_filter_batch_uses_overridden_is_allowed():
+    # arrange
+    class SizeFilter(BountyFilter):
+        def is_allowed(self, metadata):
+            return metadata.get('filesize', 0) < 100
+
+    bounty_filter = SizeFilter([Filter('mimetype', FilterComparison.EQ, 'text/plain')], None)
+    metadata = [{'mimetype': 'text/plain', 'filesize': 200}, {'mimetype': 'image/png', 'filesize': 20}]
+    # act
+    allowed = bounty_filter.filter_batch(metadata)
+    # assert
+    assert allowed == [False, True]
+
+
+def test_filter_batch_uses_overridden_filter():
+    # arrange
+    class CaseInsensitiveFilter(Filter):
+        def filter(self, metadata):
+            return str(metadata.get(self.key, '')).lower() == self.target_value
+
+    bounty_filter = BountyFilter([CaseInsensitiveFilter('mimetype', FilterComparison.EQ, 'text/plain')], None)
+    metadata = [{'mimetype': 'TEXT/PLAIN'}, {'mimetype': 'image/png'}]
+    # act
+    allowed = bounty_filter.filter_batch(metadata)
+    # assert
+    assert allowed == [True, False]
+    assert allowed == [bounty_filter.is_allowed(m) for m in metadata]
+
+
+def test_filter_batch_on_custom_metadata_filter():
+    # arrange
+    class PlainTextFilter(MetadataFilter):
+        def is_allowed(self, metadata):
+            return metadata.get('mimetype') == 'text/plain'
+
+    metadata = [{'mimetype': 'text/plain'}, {'mimetype': 'image/png'}]
+    # act
+    allowed = PlainTextFilter().filter_batch(metadata)
+    # assert
+    assert allowed == [True, False]
+
+
 def test_not_penlized():
     # arrange
     bounty_filter = ConfidenceModifier(None, [Filter('mimetype', FilterComparison.EQ, 'text/plain')])
@@ -363,6 +458,14 @@ def test_filter_comparison_from_regex():
     assert comparison == FilterComparison.REGEX
 
 
+def test_filter_comparison_from_unknown():
+    # arrange
+    # assert
+    comparison = FilterComparison.from_string('unknown')
+    # act
+    assert comparison is None
+
+
 def test_none_does_not_match():
     # arrange
     text_filter = Filter('mimetype', FilterComparison.EQ, 'text/plain')
@@ -680,6 +783,16 @@ def test_endswith_ints_match():
     assert match
 
 
+def test_gt_no_match_non_number_target():
+    # arrange
+    metadata = {'filesize': '20'}
+    size_filter = Filter('filesize', FilterComparison.GT, 'asdf')
+    # act
+    match = size_filter.filter(metadata)
+    # assert
+    assert not match
+
+
 def test_regex_matches():
     # arrange
     metadata = {'field': 'asdf'}
@@ -710,6 +823,28 @@ def test_regex_ints_match():
     assert match
 
 
+def test_regex_anchored_pattern_matches():
+    # arrange
+    metadata = {'field': 'asdf'}
+    regex_filter = Filter('field', FilterComparison.REGEX, '^a.*f$')
+    # act
+    match = regex_filter.filter(metadata)
+    # assert
+    assert match
+
+
+def test_regex_invalid_pattern_raises():
+    # assert
+    with pytest.raises(re.error):
+        Filter('field', FilterComparison.REGEX, '(')
+
+
+def test_parse_filters_invalid_regex_bad_parameter():
+    # assert
+    with pytest.raises(click.BadParameter):
+        parse_filters(None, None, [('accept', 'mimetype', 'regex', '(')])
+
+
 def test_empty_dict_no_match():
     # arrange
     metadata = {}
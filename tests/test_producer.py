@@ -0,0 +1,192 @@
+import asyncio
+import json
+
+import pytest
+from polyswarmartifact import ArtifactType
+
+from polyswarmclient.filters.bountyfilter import BountyFilter
+from polyswarmclient.filters.confidencefilter import ConfidenceModifier
+from polyswarmclient.producer import KEY_TIMEOUT, Producer
+
+
+class FakeClient:
+    polyswarmd_uri = 'http://localhost:31337'
+
+    def __init__(self, num_artifacts):
+        self.num_artifacts = num_artifacts
+
+    async def list_artifacts(self, uri):
+        return [('file', uri)] * self.num_artifacts
+
+
+class FakeTransaction:
+    """MULTI/EXEC of an LRANGE and DEL, results resolve on execute like aioredis"""
+
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    def lrange(self, key, start, stop):
+        future = asyncio.get_event_loop().create_future()
+        self.commands.append(('lrange', key, future))
+        return future
+
+    def delete(self, key):
+        self.commands.append(('delete', key, None))
+
+    async def execute(self):
+        self.redis.calls.append('multi_exec')
+        for command, key, future in self.commands:
+            if command == 'lrange':
+                future.set_result(list(self.redis.lists.get(key, [])))
+            else:
+                self.redis.lists.pop(key, None)
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    def incrby(self, key, amount):
+        self.commands.append(('incrby', key, amount))
+
+    def expire(self, key, timeout):
+        self.commands.append(('expire', key, timeout))
+
+    async def execute(self):
+        self.redis.pipelined.extend(self.commands)
+
+
+class FakeRedis:
+    """Just enough of an aioredis pool for Producer.scan
+
+    Jobs pushed to a queue are answered by calling `respond` with each decoded job, and the responses are pushed to
+    the result key the producer derives from its queue, the bounty guid and the chain.
+    """
+
+    def __init__(self, respond=None):
+        self.respond = respond
+        self.lists = {}
+        self.calls = []
+        self.pipelined = []
+        self.result_keys = []
+
+    def __await__(self):
+        yield from asyncio.sleep(0).__await__()
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        pass
+
+    async def rpush(self, key, *values):
+        self.calls.append('rpush')
+        self.lists.setdefault(key, []).extend(values)
+        if self.respond is None:
+            return
+
+        for value in values:
+            job = json.loads(value)
+            result_key = f'{key}_{job["guid"]}_{job["chain"]}_results'
+            if result_key not in self.result_keys:
+                self.result_keys.append(result_key)
+            response = self.respond(job)
+            if response is not None:
+                self.lists.setdefault(result_key, []).append(json.dumps(response).encode())
+
+    async def blpop(self, key, timeout=0):
+        self.calls.append('blpop')
+        results = self.lists.get(key)
+        if results:
+            return key, results.pop(0)
+
+        # Nothing will arrive, block until the server side timeout
+        await asyncio.sleep(timeout)
+        return None
+
+    def multi_exec(self):
+        return FakeTransaction(self)
+
+    def pipeline(self):
+        return FakePipeline(self)
+
+
+def verdict_response(job):
+    return {'index': job['index'], 'bit': True, 'verdict': job['index'] % 2 == 0, 'confidence': 1.0,
+            'metadata': ''}
+
+
+@pytest.mark.asyncio
+async def test_scan_collects_single_result():
+    # arrange
+    producer = Producer(FakeClient(1), 'redis://localhost', 'queue', 1)
+    producer.redis = FakeRedis(verdict_response)
+    # act
+    results = await producer.scan('guid', ArtifactType.FILE, 'uri', 3, None, 'side')
+    # assert
+    assert [(result.bit, result.verdict) for result in results] == [(True, True)]
+    assert producer.redis.calls == ['rpush', 'blpop']
+    result_key = producer.redis.result_keys[0]
+    assert producer.redis.pipelined == [('incrby', producer.result_counter_key, 1), ('expire', result_key, KEY_TIMEOUT)]
+
+
+@pytest.mark.asyncio
+async def test_scan_drains_batched_results():
+    # arrange
+    producer = Producer(FakeClient(3), 'redis://localhost', 'queue', 1)
+    producer.redis = FakeRedis(verdict_response)
+    # act
+    results = await producer.scan('guid', ArtifactType.FILE, 'uri', 3, None, 'side')
+    # assert
+    assert [(result.bit, result.verdict) for result in results] == [(True, True), (True, False), (True, True)]
+    # One blocking pop for the first result, the other two come back in a single MULTI/EXEC
+    assert producer.redis.calls == ['rpush', 'blpop', 'multi_exec']
+    assert producer.redis.pipelined[0] == ('incrby', producer.result_counter_key, 3)
+
+
+@pytest.mark.asyncio
+async def test_scan_times_out_without_results():
+    # arrange
+    producer = Producer(FakeClient(2), 'redis://localhost', 'queue', 1)
+    producer.redis = FakeRedis(lambda job: None)
+    # act
+    results = await asyncio.wait_for(producer.scan('guid', ArtifactType.FILE, 'uri', 1.1, None, 'side'), 1)
+    # assert
+    assert [(result.bit, result.verdict) for result in results] == [(False, False), (False, False)]
+    assert producer.redis.pipelined[0] == ('incrby', producer.result_counter_key, 0)
+
+
+@pytest.mark.asyncio
+async def test_scan_skips_out_of_range_worker_index():
+    # arrange
+    def respond(job):
+        # Answer the first job correctly, the others with indexes past either end of the bounty
+        return {**verdict_response(job), 'index': {0: 0, 1: 5, 2: -1}[job['index']]}
+
+    # The confidence modifier reads the metadata at the worker supplied index
+    producer = Producer(FakeClient(3), 'redis://localhost', 'queue', 1, confidence_modifier=ConfidenceModifier([], []))
+    producer.redis = FakeRedis(respond)
+    # act
+    results = await producer.scan('guid', ArtifactType.FILE, 'uri', 3, None, 'side')
+    # assert
+    assert [(result.bit, result.verdict) for result in results] == [(True, True), (False, False), (False, False)]
+
+
+@pytest.mark.asyncio
+async def test_scan_uses_overridden_is_allowed():
+    # arrange
+    class SecondArtifactOnly(BountyFilter):
+        def is_allowed(self, metadata):
+            return metadata.get('mimetype') == 'text/plain'
+
+    metadata = [{'mimetype': 'image/png'}, {'mimetype': 'text/plain'}]
+    producer = Producer(FakeClient(2), 'redis://localhost', 'queue', 1, bounty_filter=SecondArtifactOnly(None, None))
+    producer.redis = FakeRedis(verdict_response)
+    # act
+    results = await producer.scan('guid', ArtifactType.FILE, 'uri', 3, metadata, 'side')
+    # assert
+    assert [json.loads(job)['index'] for job in producer.redis.lists['queue']] == [1]
+    assert [(result.bit, result.verdict) for result in results] == [(False, False), (True, False)]